@@ -1,4 +1,6 @@
 import os
+import errno
+import math
 import shutil
 import time
 from pathlib import Path
@@ -8,166 +10,230 @@ from rich.table import Table
 from rich.progress import Progress
 import mimetypes
 import hashlib
+import mmap
+import zipfile
 from collections import defaultdict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import magic
+    # Loading the signature database is costly, so share one instance
+    _MIME = magic.Magic(mime=True)
+except Exception:  # not installed, or libmagic itself is missing
+    _MIME = None
 
 console = Console()
 
+# Files above this size are memory-mapped and hashed without copying into Python
+MMAP_HASH_THRESHOLD = 1 << 20  # 1MB
+# Same-sized files are compared by this many leading bytes before a full hash
+HEAD_HASH_SIZE = 65536  # 64KB
+# Files below this size are hashed with a single read, larger ones in chunks
+ONE_SHOT_HASH_SIZE = 16 << 20  # 16MB
+HASH_CHUNK_SIZE = 1 << 20  # 1MB
+# Hashing releases the GIL, so threads overlap disk reads with hash compute
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Max files handed to a worker per task, so huge trees don't pay for one future per file
+HASH_BATCH_SIZE = 64
+# Files processed between progress bar updates
+PROGRESS_BATCH_SIZE = 100
+
+
+# Comprehensive file format mapping
+KNOWN_FORMATS = MappingProxyType({
+    # Images
+    'JPG': ('.jpg', '.jpeg', '.jpe', '.jif', '.jfif'),
+    'PNG': ('.png',),
+    'GIF': ('.gif',),
+    'RAW': ('.raw', '.arw', '.cr2', '.nrw', '.k25', '.dng'),
+    'PSD': ('.psd', '.psb'),
+    'AI': ('.ai',),
+    'TIFF': ('.tiff', '.tif'),
+    'BMP': ('.bmp',),
+    'HEIC': ('.heic',),
+    'SVG': ('.svg',),
+    'WEBP': ('.webp',),
+    'ICO': ('.ico',),
+
+    # Video
+    'MP4': ('.mp4', '.m4v', '.m4p'),
+    'AVI': ('.avi',),
+    'MOV': ('.mov', '.qt'),
+    'WMV': ('.wmv',),
+    'FLV': ('.flv', '.f4v', '.f4p', '.f4a', '.f4b'),
+    'MKV': ('.mkv',),
+    'WEBM': ('.webm',),
+    '3GP': ('.3gp', '.3g2'),
+    'MPEG': ('.mpeg', '.mpg', '.mpe', '.mpv'),
+
+    # Audio
+    'MP3': ('.mp3',),
+    'WAV': ('.wav',),
+    'FLAC': ('.flac',),
+    'M4A': ('.m4a',),
+    'AAC': ('.aac',),
+    'OGG': ('.ogg', '.oga'),
+    'WMA': ('.wma',),
+    'MIDI': ('.midi', '.mid'),
+    'AMR': ('.amr',),
+
+    # Documents
+    'PDF': ('.pdf',),
+    'DOC': ('.doc', '.docx', '.docm'),
+    'XLS': ('.xls', '.xlsx', '.xlsm'),
+    'PPT': ('.ppt', '.pptx', '.pptm'),
+    'TXT': ('.txt', '.text', '.md', '.markdown'),
+    'RTF': ('.rtf',),
+    'ODT': ('.odt',),
+    'CSV': ('.csv',),
+    'EPUB': ('.epub',),
+    'MOBI': ('.mobi',),
+
+    # Code
+    'PY': ('.py', '.pyw', '.pyc', '.pyo', '.pyd'),
+    'JAVA': ('.java', '.class', '.jar'),
+    'JS': ('.js', '.jsx', '.mjs'),
+    'HTML': ('.html', '.htm', '.xhtml'),
+    'CSS': ('.css', '.scss', '.sass'),
+    'PHP': ('.php', '.phtml', '.php3', '.php4', '.php5'),
+    'CPP': ('.cpp', '.cc', '.cxx', '.c++', '.hpp'),
+    'C': ('.c', '.h'),
+    'GO': ('.go',),
+    'TS': ('.ts', '.tsx'),
+    'SQL': ('.sql',),
+    'R': ('.r', '.R'),
+
+    # Design & Creative
+    'CUBE': ('.cube',),
+    'LUT': ('.lut',),
+    '3DL': ('.3dl',),
+    'ICC': ('.icc', '.icm'),
+    'DCP': ('.dcp',),
+    'XMP': ('.xmp',),
+    'PRESET': ('.xmp', '.lrtemplate', '.dng'),
+    'FIG': ('.fig',),
+    'XD': ('.xd',),
+
+    # Archives
+    'ZIP': ('.zip', '.zipx'),
+    'RAR': ('.rar',),
+    '7Z': ('.7z',),
+    'TAR': ('.tar', '.gz', '.bz2', '.xz'),
+    'ISO': ('.iso',),
+
+    # Executables & Installers
+    'EXE': ('.exe', '.msi', '.msix'),
+    'APP': ('.app',),
+    'DMG': ('.dmg',),
+    'APK': ('.apk', '.aab'),
+    'IPA': ('.ipa',),
+
+    # Development
+    'GIT': ('.git',),
+    'CONFIG': ('.config', '.conf', '.cfg', '.ini'),
+    'ENV': ('.env', '.env.local', '.env.development'),
+    'YAML': ('.yml', '.yaml'),
+    'JSON': ('.json',),
+    'XML': ('.xml',),
+    'LOG': ('.log',),
+
+    # Fonts
+    'TTF': ('.ttf',),
+    'OTF': ('.otf',),
+    'WOFF': ('.woff', '.woff2'),
+
+    # 3D & CAD
+    'STL': ('.stl',),
+    'OBJ': ('.obj',),
+    'FBX': ('.fbx',),
+    'BLEND': ('.blend',),
+    '3DS': ('.3ds',),
+
+    # Database
+    'DB': ('.db', '.sqlite', '.sqlite3'),
+    'MDB': ('.mdb', '.accdb'),
+
+    # Game Development
+    'UNITY': ('.unity', '.prefab', '.asset'),
+    'UE': ('.uasset', '.umap'),
+
+    # Virtual Machines
+    'VMDK': ('.vmdk',),
+    'VDI': ('.vdi',),
+    'OVA': ('.ova',),
+
+    # Cryptocurrency
+    'WALLET': ('.wallet',),
+    'DAT': ('.dat',),
+
+    # Capture One & Other
+    'COP': ('.cop',),
+    'COF': ('.cof',),
+    'CR3': ('.cr3',),
+    'RAF': ('.raf',),
+    'RW2': ('.rw2',),
+
+    # Adobe & Creative
+    'INDD': ('.indd',),
+    'AEP': ('.aep',),
+    'PRPROJ': ('.prproj',),
+})
+
+# Reverse mapping for quick extension lookup
+EXTENSION_MAP = MappingProxyType(
+    {ext: category for category, extensions in KNOWN_FORMATS.items() for ext in extensions}
+)
+
+MIME_CATEGORIES = MappingProxyType({
+    'image': 'Images',
+    'video': 'Videos',
+    'audio': 'Audio',
+    'text': 'Documents'
+})
+
+# Extensions of already-compressed formats that gain nothing from zipping
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.jpe', '.jif', '.jfif', '.png', '.gif', '.heic', '.webp',
+    '.mp4', '.m4v', '.m4p', '.avi', '.mov', '.qt', '.wmv', '.flv', '.f4v', '.mkv', '.webm',
+    '.3gp', '.3g2', '.mpeg', '.mpg',
+    '.mp3', '.flac', '.m4a', '.aac', '.ogg', '.oga', '.wma',
+    '.docx', '.docm', '.xlsx', '.xlsm', '.pptx', '.pptm', '.odt', '.epub',
+    '.zip', '.zipx', '.rar', '.7z', '.gz', '.bz2', '.xz',
+    '.jar', '.apk', '.aab', '.ipa', '.dmg',
+})
+
+# Dropped into top-level folders the organizer creates, so repeat runs can skip them
+ORGANIZER_MARKER = '.smart_organizer'
+
+
+def _new_hasher():
+    """Fastest available non-cryptographic hasher for duplicate detection"""
+    if blake3 is not None:
+        return blake3.blake3()
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b()
+
+
 class SmartFileOrganizer:
     def __init__(self, directory):
         self.directory = Path(directory)
-        # Comprehensive file format mapping
-        self.known_formats = {
-            # Images
-            'JPG': ['.jpg', '.jpeg', '.jpe', '.jif', '.jfif'],
-            'PNG': ['.png'],
-            'GIF': ['.gif'],
-            'RAW': ['.raw', '.arw', '.cr2', '.nrw', '.k25', '.dng'],
-            'PSD': ['.psd', '.psb'],
-            'AI': ['.ai'],
-            'TIFF': ['.tiff', '.tif'],
-            'BMP': ['.bmp'],
-            'HEIC': ['.heic'],
-            'SVG': ['.svg'],
-            'WEBP': ['.webp'],
-            'ICO': ['.ico'],
-            
-            # Video
-            'MP4': ['.mp4', '.m4v', '.m4p'],
-            'AVI': ['.avi'],
-            'MOV': ['.mov', '.qt'],
-            'WMV': ['.wmv'],
-            'FLV': ['.flv', '.f4v', '.f4p', '.f4a', '.f4b'],
-            'MKV': ['.mkv'],
-            'WEBM': ['.webm'],
-            '3GP': ['.3gp', '.3g2'],
-            'MPEG': ['.mpeg', '.mpg', '.mpe', '.mpv'],
-            
-            # Audio
-            'MP3': ['.mp3'],
-            'WAV': ['.wav'],
-            'FLAC': ['.flac'],
-            'M4A': ['.m4a'],
-            'AAC': ['.aac'],
-            'OGG': ['.ogg', '.oga'],
-            'WMA': ['.wma'],
-            'MIDI': ['.midi', '.mid'],
-            'AMR': ['.amr'],
-            
-            # Documents
-            'PDF': ['.pdf'],
-            'DOC': ['.doc', '.docx', '.docm'],
-            'XLS': ['.xls', '.xlsx', '.xlsm'],
-            'PPT': ['.ppt', '.pptx', '.pptm'],
-            'TXT': ['.txt', '.text', '.md', '.markdown'],
-            'RTF': ['.rtf'],
-            'ODT': ['.odt'],
-            'CSV': ['.csv'],
-            'EPUB': ['.epub'],
-            'MOBI': ['.mobi'],
-            
-            # Code
-            'PY': ['.py', '.pyw', '.pyc', '.pyo', '.pyd'],
-            'JAVA': ['.java', '.class', '.jar'],
-            'JS': ['.js', '.jsx', '.mjs'],
-            'HTML': ['.html', '.htm', '.xhtml'],
-            'CSS': ['.css', '.scss', '.sass'],
-            'PHP': ['.php', '.phtml', '.php3', '.php4', '.php5'],
-            'CPP': ['.cpp', '.cc', '.cxx', '.c++', '.hpp'],
-            'C': ['.c', '.h'],
-            'GO': ['.go'],
-            'TS': ['.ts', '.tsx'],
-            'SQL': ['.sql'],
-            'R': ['.r', '.R'],
-            
-            # Design & Creative
-            'CUBE': ['.cube'],
-            'LUT': ['.lut'],
-            '3DL': ['.3dl'],
-            'ICC': ['.icc', '.icm'],
-            'DCP': ['.dcp'],
-            'XMP': ['.xmp'],
-            'PRESET': ['.xmp', '.lrtemplate', '.dng'],
-            'FIG': ['.fig'],
-            'XD': ['.xd'],
-            
-            # Archives
-            'ZIP': ['.zip', '.zipx'],
-            'RAR': ['.rar'],
-            '7Z': ['.7z'],
-            'TAR': ['.tar', '.gz', '.bz2', '.xz'],
-            'ISO': ['.iso'],
-            
-            # Executables & Installers
-            'EXE': ['.exe', '.msi', '.msix'],
-            'APP': ['.app'],
-            'DMG': ['.dmg'],
-            'APK': ['.apk', '.aab'],
-            'IPA': ['.ipa'],
-            
-            # Development
-            'GIT': ['.git'],
-            'CONFIG': ['.config', '.conf', '.cfg', '.ini'],
-            'ENV': ['.env', '.env.local', '.env.development'],
-            'YAML': ['.yml', '.yaml'],
-            'JSON': ['.json'],
-            'XML': ['.xml'],
-            'LOG': ['.log'],
-            
-            # Fonts
-            'TTF': ['.ttf'],
-            'OTF': ['.otf'],
-            'WOFF': ['.woff', '.woff2'],
-            
-            # 3D & CAD
-            'STL': ['.stl'],
-            'OBJ': ['.obj'],
-            'FBX': ['.fbx'],
-            'BLEND': ['.blend'],
-            '3DS': ['.3ds'],
-            
-            # Database
-            'DB': ['.db', '.sqlite', '.sqlite3'],
-            'MDB': ['.mdb', '.accdb'],
-            
-            # Game Development
-            'UNITY': ['.unity', '.prefab', '.asset'],
-            'UE': ['.uasset', '.umap'],
-            
-            # Virtual Machines
-            'VMDK': ['.vmdk'],
-            'VDI': ['.vdi'],
-            'OVA': ['.ova'],
-            
-            # Cryptocurrency
-            'WALLET': ['.wallet'],
-            'DAT': ['.dat'],
-            
-            # Capture One & Other
-            'COP': ['.cop'],
-            'COF': ['.cof'],
-            'CR3': ['.cr3'],
-            'RAF': ['.raf'],
-            'RW2': ['.rw2'],
-            
-            # Adobe & Creative
-            'INDD': ['.indd'],
-            'AEP': ['.aep'],
-            'PRPROJ': ['.prproj'],
-        }
-        
-        # Reverse mapping for quick extension lookup
-        self.extension_map = {}
-        for category, extensions in self.known_formats.items():
-            for ext in extensions:
-                self.extension_map[ext] = category
-        
-        self.mime_categories = {
-            'image': 'Images',
-            'video': 'Videos',
-            'audio': 'Audio',
-            'text': 'Documents'
-        }
+        self.known_formats = KNOWN_FORMATS
+        self.extension_map = EXTENSION_MAP
+        self.mime_categories = MIME_CATEGORIES
         self.duplicate_hashes = defaultdict(list)
+        self._created_dirs = set()
 
     def get_file_category(self, file_path):
         """Smart file categorization with extended format support"""
@@ -184,6 +250,17 @@ class SmartFileOrganizer:
                 for mime_prefix, category in self.mime_categories.items():
                     if mime_prefix in mime_type:
                         return category
+
+            # Let libmagic identify the content from its signature database
+            if _MIME is not None:
+                try:
+                    mime_type = _MIME.from_file(str(file_path))
+                except Exception:
+                    return 'No_Extension'
+                media_type = mime_type.split('/')[0]
+                if media_type == 'text' or mime_type == 'inode/x-empty':
+                    return 'Text'
+                return self.mime_categories.get(media_type, 'Binaries')
             
             # Try to detect file type by content
             try:
@@ -213,20 +290,139 @@ class SmartFileOrganizer:
         month = file_date.strftime("%B")  # Full month name
         return f"{year}/{month}"
 
-    def calculate_file_hash(self, file_path):
-        """Calculate file hash for duplicate detection"""
-        hasher = hashlib.md5()
+    def calculate_file_hash(self, file_path, max_bytes=None, file_size=None):
+        """Calculate file hash for duplicate detection, optionally of the first max_bytes only"""
         try:
-            with open(file_path, 'rb') as f:
-                buf = f.read(65536)  # Read in 64kb chunks
-                while len(buf) > 0:
-                    hasher.update(buf)
-                    buf = f.read(65536)
+            if max_bytes is not None:
+                hasher = _new_hasher()
+                with open(file_path, 'rb') as f:
+                    hasher.update(f.read(max_bytes))
+                return hasher.hexdigest()
+
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
+            if blake3 is not None and file_size > MMAP_HASH_THRESHOLD:
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                hasher.update_mmap(file_path)
+                return hasher.hexdigest()
+
+            hasher = _new_hasher()
+            with open(file_path, 'rb', buffering=0) as f:
+                if file_size > MMAP_HASH_THRESHOLD:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            hasher.update(mm)
+                        return hasher.hexdigest()
+                    except (OSError, ValueError):
+                        # Not mappable (e.g. some network filesystems); read it instead
+                        hasher = _new_hasher()
+
+                if file_size < ONE_SHOT_HASH_SIZE:
+                    hasher.update(f.readall())
+                else:
+                    # Reuse one buffer instead of allocating a bytes object per chunk
+                    buf = bytearray(HASH_CHUNK_SIZE)
+                    view = memoryview(buf)
+                    n = f.readinto(buf)
+                    while n:
+                        hasher.update(view[:n])
+                        n = f.readinto(buf)
         except Exception:
             return None
         return hasher.hexdigest()
 
-    def organize_files(self, by_date=False, remove_duplicates=True, optimize_space=True):
+    def _ensure_dir(self, folder):
+        """Create folder once per organizer instead of once per file"""
+        if folder in self._created_dirs:
+            return
+        # Mark top-level folders we create; pre-existing user folders stay unmarked
+        top_folder = self.directory / folder.relative_to(self.directory).parts[0]
+        if not top_folder.exists():
+            top_folder.mkdir()
+            (top_folder / ORGANIZER_MARKER).touch()
+        folder.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(folder)
+
+    def _scan_files(self):
+        """Walk the directory tree once and collect all regular files with their stats"""
+        files = []
+        pending = [self.directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Don't descend into folders from a previous run
+                            if (current == self.directory
+                                    and os.path.exists(os.path.join(entry.path, ORGANIZER_MARKER))):
+                                continue
+                            pending.append(entry.path)
+                        elif entry.name == ORGANIZER_MARKER:
+                            # Our own bookkeeping, never a user file
+                            continue
+                        elif entry.is_file():
+                            try:
+                                file_stat = entry.stat()
+                            except OSError:
+                                # Vanished between readdir and stat; skip only this file
+                                continue
+                            files.append((Path(entry.path), file_stat))
+            except OSError:
+                continue
+        return files
+
+    def _hash_files(self, files, progress, description, max_bytes=None):
+        """Hash (path, size) pairs concurrently, yielding (path, hash) pairs in input order"""
+        if not files:
+            return
+        task = progress.add_task(description, total=len(files))
+        hash_file = self.calculate_file_hash
+        # Shrink batches for short lists so every worker still gets a share
+        batch_size = max(1, min(HASH_BATCH_SIZE, math.ceil(len(files) / HASH_WORKERS)))
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            results = executor.map(lambda batch: [hash_file(p, max_bytes, size) for p, size in batch], batches)
+            unreported = 0
+            for batch, hashes in zip(batches, results):
+                for (file_path, _), file_hash in zip(batch, hashes):
+                    unreported += 1
+                    if unreported >= PROGRESS_BATCH_SIZE:
+                        progress.update(task, advance=unreported)
+                        unreported = 0
+                    yield file_path, file_hash
+            progress.update(task, advance=unreported)
+
+    def _find_duplicate_candidates(self, files, progress):
+        """Narrow files down to (path, size) pairs that may have duplicates, by size then leading bytes"""
+        by_size = defaultdict(list)
+        for file_path, file_stat in files:
+            by_size[file_stat.st_size].append((file_path, file_stat.st_size))
+
+        candidates = []
+        needs_head_hash = []
+        for size, paths in by_size.items():
+            if len(paths) < 2:
+                continue
+            if size <= HEAD_HASH_SIZE:
+                candidates.extend(paths)
+            else:
+                needs_head_hash.extend(paths)
+
+        sizes = dict(needs_head_hash)
+        by_head = defaultdict(list)
+        for file_path, head_hash in self._hash_files(needs_head_hash, progress, "[cyan]Comparing files...",
+                                                     max_bytes=HEAD_HASH_SIZE):
+            if head_hash:
+                by_head[(sizes[file_path], head_hash)].append((file_path, sizes[file_path]))
+        for group in by_head.values():
+            if len(group) > 1:
+                candidates.extend(group)
+        return candidates
+
+    def organize_files(self, by_date=False, remove_duplicates=True, optimize_space=True, verbose=False):
         """Smart file organization with multiple options"""
         stats = {
             'moved': 0,
@@ -236,59 +432,66 @@ class SmartFileOrganizer:
             'years_processed': set()
         }
 
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Analyzing files...", total=len(list(self.directory.glob('**/*'))))
+        files = self._scan_files()
 
+        with Progress(refresh_per_second=4) as progress:
             # First pass: Analyze files and detect duplicates
-            for file_path in self.directory.glob('**/*'):
-                progress.update(task, advance=1)
-                if not file_path.is_file():
-                    continue
-
-                file_hash = self.calculate_file_hash(file_path)
+            candidates = self._find_duplicate_candidates(files, progress)
+            for file_path, file_hash in self._hash_files(candidates, progress, "[cyan]Analyzing files..."):
                 if file_hash:
                     self.duplicate_hashes[file_hash].append(file_path)
 
-            # Second pass: Organize files
-            progress.update(task, total=len(list(self.directory.glob('**/*'))))
-            for file_path in self.directory.glob('**/*'):
-                if not file_path.is_file():
-                    continue
+            # Keep the first file of each hash group, every later one is a duplicate
+            duplicates = {p for paths in self.duplicate_hashes.values() for p in paths[1:]}
 
+            # Second pass: Organize files
+            task = progress.add_task("[cyan]Organizing files...", total=len(files))
+            unreported = 0
+            for file_path, file_stat in files:
+                unreported += 1
+                if unreported >= PROGRESS_BATCH_SIZE:
+                    progress.update(task, advance=unreported)
+                    unreported = 0
                 try:
                     # Get file categorization
                     category = self.get_file_category(file_path)
                     if by_date:
-                        date_cat = self.get_date_category(file_path.stat().st_mtime)
+                        date_cat = self.get_date_category(file_stat.st_mtime)
                         category = f"{category}/{date_cat}"
                         year = date_cat.split('/')[0]
                         stats['years_processed'].add(year)
 
                     # Create destination folder
                     dest_folder = self.directory / category
-                    dest_folder.mkdir(parents=True, exist_ok=True)
+                    self._ensure_dir(dest_folder)
 
                     # Handle duplicates
-                    file_hash = self.calculate_file_hash(file_path)
-                    if remove_duplicates and len(self.duplicate_hashes[file_hash]) > 1:
-                        if file_path != self.duplicate_hashes[file_hash][0]:
-                            stats['duplicates'] += 1
-                            stats['space_saved'] += file_path.stat().st_size
-                            file_path.unlink()
-                            continue
+                    if remove_duplicates and file_path in duplicates:
+                        stats['duplicates'] += 1
+                        stats['space_saved'] += file_stat.st_size
+                        file_path.unlink()
+                        continue
 
                     # Move file
                     new_path = dest_folder / file_path.name
                     if new_path.exists():
                         new_path = dest_folder / f"{file_path.stem}_{int(time.time())}{file_path.suffix}"
                     
-                    shutil.move(str(file_path), str(new_path))
+                    try:
+                        file_path.rename(new_path)
+                    except OSError as e:
+                        # Only fall back to copy + delete across filesystems
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(str(file_path), str(new_path))
                     stats['moved'] += 1
-                    console.print(f"[green]Organized:[/green] {file_path.name} → {category}")
+                    if verbose:
+                        console.print(f"[green]Organized:[/green] {file_path.name} → {category}")
 
                 except Exception as e:
                     stats['errors'] += 1
                     console.print(f"[red]Error processing {file_path.name}: {str(e)}[/red]")
+            progress.update(task, advance=unreported)
 
         return stats
 
@@ -297,20 +500,27 @@ class SmartFileOrganizer:
         stats = {'compressed': 0, 'space_saved': 0}
         
         # Find large files that could be compressed
-        large_files = [f for f in self.directory.glob('**/*') 
-                      if f.is_file() and f.stat().st_size > 10_000_000]  # Files > 10MB
+        large_files = [f for f in self.directory.glob('**/*')
+                      if f.is_file() and f.stat().st_size > 10_000_000  # Files > 10MB
+                      and f.suffix.lower() not in PRECOMPRESSED_EXTENSIONS]
 
         for file_path in large_files:
+            archive_name = None
             try:
                 # Create archives folder
                 archive_dir = self.directory / 'Compressed'
-                archive_dir.mkdir(exist_ok=True)
+                self._ensure_dir(archive_dir)
+
+                # Never reuse an existing archive; its original may already be gone
+                new_archive = archive_dir / f"{file_path.stem}.zip"
+                if new_archive.exists():
+                    new_archive = archive_dir / f"{file_path.stem}_{int(time.time())}.zip"
+
+                # Compress large files, favouring speed over ratio
+                with zipfile.ZipFile(new_archive, 'x', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                    archive_name = new_archive
+                    zf.write(file_path, file_path.name)
 
-                # Compress large files
-                archive_name = archive_dir / f"{file_path.stem}.zip"
-                shutil.make_archive(str(archive_name.with_suffix('')), 'zip', 
-                                  str(file_path.parent), str(file_path.name))
-                
                 # If compression was successful, remove original
                 if archive_name.exists():
                     original_size = file_path.stat().st_size
@@ -321,8 +531,13 @@ class SmartFileOrganizer:
                         stats['compressed'] += 1
                         stats['space_saved'] += (original_size - compressed_size)
                         console.print(f"[green]Compressed:[/green] {file_path.name}")
+                    else:
+                        archive_name.unlink()
 
             except Exception as e:
+                # Drop a partial archive we created while the original is still intact
+                if archive_name is not None and archive_name.exists() and file_path.exists():
+                    archive_name.unlink()
                 console.print(f"[red]Compression failed for {file_path.name}: {str(e)}[/red]")
 
         return stats
@@ -356,12 +571,13 @@ def main():
     by_date = console.input("[cyan]Organize by date as well? (y/n): [/cyan]").lower() == 'y'
     remove_dupes = console.input("[cyan]Remove duplicate files? (y/n): [/cyan]").lower() == 'y'
     optimize = console.input("[cyan]Optimize storage space? (y/n): [/cyan]").lower() == 'y'
+    verbose = console.input("[cyan]List every organized file? (y/n): [/cyan]").lower() == 'y'
 
     # Create and run organizer
     organizer = SmartFileOrganizer(dir_path)
     
     console.print("\n[yellow]Starting smart organization...[/yellow]")
-    stats = organizer.organize_files(by_date, remove_dupes, optimize)
+    stats = organizer.organize_files(by_date, remove_dupes, optimize, verbose=verbose)
 
     if optimize:
         console.print("\n[yellow]Optimizing storage space...[/yellow]")